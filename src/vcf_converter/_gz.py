@@ -0,0 +1,87 @@
+"""Gzip-aware file opening.
+
+Decompresses ``.gz`` inputs through an external ``pigz -dc`` process
+when available, which runs multi-threaded outside the GIL, and falls
+back to the standard :mod:`gzip` module otherwise. Streams are binary.
+Corrupt or truncated input raises :class:`gzip.BadGzipFile` on either
+path.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+
+@contextmanager
+def _open_maybe_gz(path: str | Path) -> Iterator[IO[bytes]]:
+    """Open ``path`` for binary reading, decompressing ``.gz`` files."""
+    path = Path(path)
+    if path.suffix != ".gz":
+        with open(path, "rb") as fh:
+            yield fh
+        return
+
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        with gzip.open(path, "rb") as fh:
+            try:
+                yield fh
+            except EOFError as exc:
+                raise gzip.BadGzipFile(f"truncated gzip file: {path}") from exc
+        return
+
+    if not path.exists():
+        raise FileNotFoundError(f"No such file: {path}")
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen([pigz, "-dc", str(path)], stdout=subprocess.PIPE, stderr=err)
+        pipe = _PipeReader(proc.stdout)  # type: ignore[arg-type]
+        stream = io.BufferedReader(pipe)
+        try:
+            yield stream
+        except BaseException:
+            _stop(proc, stream)
+            raise
+        if not pipe.eof:
+            # Caller stopped early (e.g. header-only read); pigz is no longer needed
+            _stop(proc, stream)
+            return
+        stream.close()
+        if proc.wait() != 0:
+            err.seek(0)
+            detail = err.read().decode(errors="replace").strip()
+            raise gzip.BadGzipFile(f"pigz failed on {path}: {detail or f'exit status {proc.returncode}'}")
+
+
+class _PipeReader(io.RawIOBase):
+    """Raw reader over a subprocess pipe that records whether EOF was reached."""
+
+    def __init__(self, pipe: IO[bytes]) -> None:
+        self._pipe = pipe
+        self.eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self._pipe.readinto(buffer)
+        if not n:
+            self.eof = True
+        return n
+
+    def close(self) -> None:
+        self._pipe.close()
+        super().close()
+
+
+def _stop(proc: subprocess.Popen, stream: IO) -> None:
+    stream.close()
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
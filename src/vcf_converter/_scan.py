@@ -0,0 +1,133 @@
+"""Byte-level VCF body scanning.
+
+Counts variant records in an uncompressed VCF buffer. Uses a Numba
+kernel when ``numba`` is installed and falls back to a Python loop
+otherwise. Also provides chunked newline counters for plain record
+files such as .bim/.fam and a readahead hint for sequential scans.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from contextlib import contextmanager, suppress
+from typing import BinaryIO, Iterator
+
+_HAVE_FADVISE = hasattr(os, "posix_fadvise")
+
+_HASH = 0x23
+_LF = 0x0A
+_CR = 0x0D
+
+# numba and numpy take a few hundred milliseconds to import, so the kernel
+# is compiled on the first count_body_lines() call rather than at import.
+_KERNEL_UNSET = object()
+_kernel = _KERNEL_UNSET
+
+
+def _get_kernel():
+    """Return the Numba body counter ``(buf, start) -> int``, or ``None`` without numba."""
+    global _kernel
+    if _kernel is _KERNEL_UNSET:
+        try:
+            import numpy as np
+            from numba import njit
+        except ImportError:  # pragma: no cover - optional dependency
+            _kernel = None
+        else:
+
+            @njit(cache=True)
+            def _count_body_kernel(buf):  # pragma: no cover - requires numba
+                count = 0
+                at_line_start = True
+                for i in range(buf.shape[0]):
+                    c = buf[i]
+                    if at_line_start:
+                        if c != _HASH and c != _LF and c != _CR:
+                            count += 1
+                        at_line_start = False
+                    if c == _LF:
+                        at_line_start = True
+                return count
+
+            def _run_kernel(buf, start=0):
+                return int(_count_body_kernel(np.frombuffer(buf, dtype=np.uint8, offset=start)))
+
+            _kernel = _run_kernel
+
+    return _kernel
+
+
+def count_body_lines(buf, start: int = 0) -> int:
+    """Count non-blank, non-``#`` lines in ``buf`` from offset ``start``.
+
+    ``buf`` may be ``bytes`` or a read-only ``mmap``.
+    """
+    kernel = _get_kernel()
+    if kernel is not None:
+        return kernel(buf, start)
+    return _count_body_python(buf, start)
+
+
+def _count_body_python(buf, start: int = 0) -> int:
+    if isinstance(buf, mmap.mmap):
+        buf.seek(start)
+        lines = iter(buf.readline, b"")
+    else:
+        lines = bytes(buf[start:]).split(b"\n")
+
+    count = 0
+    for line in lines:
+        if line and line[0] not in (_HASH, _LF, _CR):
+            count += 1
+    return count
+
+
+def count_lines(fh: BinaryIO, chunk_size: int = 1 << 20) -> int:
+    """Count newline-terminated records from the current position of ``fh``."""
+    count = 0
+    last = b"\n"
+    while chunk := fh.read(chunk_size):
+        count += chunk.count(b"\n")
+        last = chunk[-1:]
+    # Unterminated final record
+    if last != b"\n":
+        count += 1
+    return count
+
+
+def count_newlines(fd: int, chunk_size: int = 1 << 20) -> int:
+    """Count newline-terminated records read from file descriptor ``fd``.
+
+    Reads into one reused buffer through an unbuffered ``FileIO``, which
+    drops the GIL for each ``read()`` and allocates nothing per chunk.
+    """
+    buf = bytearray(chunk_size)
+    count = 0
+    last = _LF
+    with memoryview(buf) as view, open(fd, "rb", buffering=0, closefd=False) as fh:
+        while n := fh.readinto(view):
+            count += buf.count(b"\n", 0, n)
+            last = buf[n - 1]
+    # Unterminated final record
+    if last != _LF:
+        count += 1
+    return count
+
+
+@contextmanager
+def sequential_access(fd: int) -> Iterator[None]:
+    """Advise the kernel that ``fd`` is read once, front to back.
+
+    Widens readahead on entry and drops the file's cached pages on exit.
+    A no-op where ``posix_fadvise`` is unavailable.
+    """
+    if _HAVE_FADVISE:
+        with suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    try:
+        yield
+    finally:
+        if _HAVE_FADVISE:
+            with suppress(OSError):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
@@ -6,13 +6,26 @@ with validation and sample/variant counting.
 
 from __future__ import annotations
 
+import os
+import re
+import shlex
+import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
+from ._compat import DATACLASS_SLOTS
+from ._scan import count_newlines, sequential_access
 
-@dataclass
+# PLINK 1.9 summary line, e.g. "1234 variants and 56 people pass filters and QC."
+_PLINK_COUNTS_RE = re.compile(r"(\d+) variants? and (\d+) (?:people|samples)")
+
+# Printed with the exit status after each job of a batch shell script
+_JOB_END_MARKER = "__vcf_converter_job_end__"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ConversionResult:
     """Outcome of a format conversion."""
 
@@ -37,6 +50,9 @@ class FormatConverter:
         Path to the bcftools binary.
     """
 
+    _VCF_TO_PLINK_TAIL = ("--make-bed", "--allow-extra-chr")
+    _PLINK_TO_VCF_TAIL = ("--recode", "vcf", "--allow-extra-chr")
+
     def __init__(
         self,
         plink_binary: str = "plink",
@@ -44,6 +60,24 @@ class FormatConverter:
     ) -> None:
         self.plink_binary = plink_binary
         self.bcftools_binary = bcftools_binary
+        # (plink_binary, resolved path); refreshed when plink_binary changes
+        self._plink_cache: Optional[Tuple[str, str]] = None
+
+    def _resolve_plink(self) -> Optional[str]:
+        """Return the PATH-resolved PLINK binary, or None if it cannot be found.
+
+        Successful lookups are cached against the current ``plink_binary``.
+        """
+        if self._plink_cache is not None and self._plink_cache[0] == self.plink_binary:
+            return self._plink_cache[1]
+        resolved = shutil.which(self.plink_binary)
+        if resolved is not None:
+            self._plink_cache = (self.plink_binary, resolved)
+        return resolved
+
+    def _require_plink(self) -> None:
+        if self._resolve_plink() is None:
+            raise FileNotFoundError(f"PLINK binary not found: {self.plink_binary}")
 
     def _build_vcf_to_plink_cmd(
         self,
@@ -51,16 +85,13 @@ class FormatConverter:
         output_prefix: str,
         extra_args: List[str] | None = None,
     ) -> List[str]:
-        cmd = [
-            self.plink_binary,
+        return [
+            self._resolve_plink() or self.plink_binary,
             "--vcf", vcf_path,
-            "--make-bed",
             "--out", output_prefix,
-            "--allow-extra-chr",
+            *self._VCF_TO_PLINK_TAIL,
+            *(extra_args or ()),
         ]
-        if extra_args:
-            cmd.extend(extra_args)
-        return cmd
 
     def _build_plink_to_vcf_cmd(
         self,
@@ -68,16 +99,13 @@ class FormatConverter:
         output_path: str,
         extra_args: List[str] | None = None,
     ) -> List[str]:
-        cmd = [
-            self.plink_binary,
+        return [
+            self._resolve_plink() or self.plink_binary,
             "--bfile", bfile_prefix,
-            "--recode", "vcf",
             "--out", output_path,
-            "--allow-extra-chr",
+            *self._PLINK_TO_VCF_TAIL,
+            *(extra_args or ()),
         ]
-        if extra_args:
-            cmd.extend(extra_args)
-        return cmd
 
     def vcf_to_plink(
         self,
@@ -94,14 +122,75 @@ class FormatConverter:
             output_format="plink_binary",
         )
         try:
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
+            self._require_plink()
+            proc = subprocess.run(cmd, check=True, capture_output=True, text=True)
             result.success = True
-            result.sample_count = self._count_fam_samples(f"{output_prefix}.fam")
-            result.variant_count = self._count_bim_variants(f"{output_prefix}.bim")
+            self._fill_counts(result, proc.stdout, output_prefix)
         except (subprocess.CalledProcessError, FileNotFoundError) as exc:
             result.message = str(exc)
         return result
 
+    def vcf_to_plink_batch(
+        self,
+        jobs: List[Tuple[str, str]],
+        extra_args: List[str] | None = None,
+    ) -> List[ConversionResult]:
+        """Convert several ``(vcf_path, output_prefix)`` pairs in one shell session.
+
+        All jobs run sequentially under a single ``sh`` process, so Python
+        spawns one subprocess for the whole batch. Each job's log is split
+        out of the combined output to fill its counts. A failing job does not
+        stop the rest.
+        """
+        results = [
+            ConversionResult(
+                input_path=vcf_path,
+                output_prefix=output_prefix,
+                input_format="vcf",
+                output_format="plink_binary",
+            )
+            for vcf_path, output_prefix in jobs
+        ]
+        if not jobs:
+            return results
+
+        cmds = [self._build_vcf_to_plink_cmd(v, o, extra_args) for v, o in jobs]
+        # The leading newline keeps the marker on its own line even when
+        # PLINK's output does not end with one
+        # The script goes to sh on stdin, so batch size is not bounded by the
+        # per-argument limit; jobs get /dev/null so they cannot consume it
+        script = "\n".join(
+            f"{shlex.join(cmd)} </dev/null 2>&1; printf '\\n%s %s\\n' {_JOB_END_MARKER} $?" for cmd in cmds
+        )
+        try:
+            self._require_plink()
+            proc = subprocess.run(["sh", "-s"], input=script, check=False, capture_output=True, text=True)
+        except OSError as exc:
+            for result in results:
+                result.message = str(exc)
+            return results
+
+        idx = 0
+        log: List[str] = []
+        for line in proc.stdout.splitlines():
+            if not line.startswith(_JOB_END_MARKER) or idx >= len(results):
+                log.append(line)
+                continue
+            if log and not log[-1]:
+                log.pop()
+            result = results[idx]
+            returncode = int(line.split()[1])
+            if returncode == 0:
+                result.success = True
+                self._fill_counts(result, "\n".join(log), result.output_prefix)
+            else:
+                result.message = str(subprocess.CalledProcessError(returncode, cmds[idx]))
+            idx += 1
+            log = []
+        for result in results[idx:]:
+            result.message = "Batch aborted before this job ran"
+        return results
+
     def plink_to_vcf(
         self,
         bfile_prefix: str,
@@ -117,24 +206,79 @@ class FormatConverter:
             output_format="vcf",
         )
         try:
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
+            self._require_plink()
+            proc = subprocess.run(cmd, check=True, capture_output=True, text=True)
             result.success = True
+            self._fill_counts(result, proc.stdout, bfile_prefix)
         except (subprocess.CalledProcessError, FileNotFoundError) as exc:
             result.message = str(exc)
         return result
 
+    @staticmethod
+    def _parse_plink_counts(stdout: str) -> Optional[Tuple[int, int]]:
+        """Extract ``(variant_count, sample_count)`` from PLINK's log output."""
+        match = _PLINK_COUNTS_RE.search(stdout or "")
+        if match is None:
+            return None
+        return int(match.group(1)), int(match.group(2))
+
+    def estimate_counts(self, bfile_prefix: str) -> Tuple[int, int]:
+        """Estimate ``(sample_count, variant_count)`` of an existing PLINK fileset.
+
+        Reads at most 1 MiB of each of the .fam and .bim files and scales by
+        file size, so the cost is constant however large the fileset is.
+        Exact for files under 1 MiB; use for progress bars or shard planning.
+        """
+        return (
+            self._approx_count_lines(f"{bfile_prefix}.fam"),
+            self._approx_count_lines(f"{bfile_prefix}.bim"),
+        )
+
+    def _fill_counts(self, result: ConversionResult, stdout: str, bfile_prefix: str) -> None:
+        """Populate counts from PLINK's log, re-reading .fam/.bim only if it has none."""
+        counts = self._parse_plink_counts(stdout)
+        if counts is not None:
+            result.variant_count, result.sample_count = counts
+        else:
+            result.sample_count = self._count_fam_samples(f"{bfile_prefix}.fam")
+            result.variant_count = self._count_bim_variants(f"{bfile_prefix}.bim")
+
+    @staticmethod
+    def _count_lines(path: Path, chunk_size: int = 1 << 20) -> int:
+        """Count newline-terminated records by scanning raw byte chunks."""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            with sequential_access(fd):
+                return count_newlines(fd, chunk_size)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _approx_count_lines(path: str, sample: int = 1 << 20) -> int:
+        """Estimate the line count from the mean line length of the leading bytes.
+
+        Exact when the whole file fits in ``sample``; returns 0 for a missing file.
+        """
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            return 0
+        with open(path, "rb") as fh:
+            head = fh.read(sample)
+        newlines = head.count(b"\n")
+        if len(head) >= size:
+            return newlines + (1 if head and not head.endswith(b"\n") else 0)
+        if newlines == 0:
+            return 1
+        return round(size * newlines / len(head))
+
     @staticmethod
     def _count_fam_samples(fam_path: str) -> int:
         """Count samples in a .fam file."""
         path = Path(fam_path)
         if not path.exists():
             return 0
-        count = 0
-        with open(path) as fh:
-            for line in fh:
-                if line.strip():
-                    count += 1
-        return count
+        return FormatConverter._count_lines(path)
 
     @staticmethod
     def _count_bim_variants(bim_path: str) -> int:
@@ -142,9 +286,4 @@ class FormatConverter:
         path = Path(bim_path)
         if not path.exists():
             return 0
-        count = 0
-        with open(path) as fh:
-            for line in fh:
-                if line.strip():
-                    count += 1
-        return count
+        return FormatConverter._count_lines(path)
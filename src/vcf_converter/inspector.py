@@ -6,13 +6,37 @@ requiring external tools.
 
 from __future__ import annotations
 
-import gzip
+import hashlib
+import mmap
+import os
+import re
+import stat
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
+from ._compat import DATACLASS_SLOTS
+from ._gz import _open_maybe_gz
+from ._scan import count_body_lines, count_lines, count_newlines, sequential_access
 
-@dataclass
+_META_RE = re.compile(rb"^##(contig|INFO|FORMAT)=<ID=([^,>\r\n]+)")
+
+# Per-key sink for header IDs: the result list itself, or a NUL-joined buffer
+_IdTargets = Dict[bytes, Union[List[str], bytearray]]
+
+# (header_line_count, sample_count, contigs, info_fields, format_fields)
+_ParsedHeader = Tuple[int, int, Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]
+
+# Opt-in header parse cache (VCFInspector(cache_headers=True)), keyed by digest
+_HEADER_CACHE: OrderedDict[bytes, _ParsedHeader] = OrderedDict()
+_HEADER_CACHE_LOCK = threading.Lock()
+_HEADER_CACHE_SIZE = 16
+_HEADER_CACHE_MAX_BYTES = 1 << 20
+
+
+@dataclass(**DATACLASS_SLOTS)
 class InspectionResult:
     """VCF inspection summary."""
 
@@ -30,56 +54,216 @@ class VCFInspector:
 
     Parses the VCF header to extract sample names, contig info,
     and INFO/FORMAT fields, then counts data lines for variant total.
+
+    Parameters
+    ----------
+    buffer_ids : bool
+        Accumulate contig/INFO/FORMAT IDs in one byte buffer per kind and
+        split it once at the end; worthwhile for headers with very many
+        contigs.
+    cache_headers : bool
+        Reuse the parse of headers already seen in this process, for cohorts
+        whose shards share one header. Headers over 1 MiB are not cached, and
+        the cache is bypassed when ``buffer_ids`` is set.
     """
 
-    def inspect(self, vcf_path: str | Path) -> InspectionResult:
-        """Inspect a VCF file."""
+    def __init__(self, buffer_ids: bool = False, cache_headers: bool = False) -> None:
+        self.buffer_ids = buffer_ids
+        self.cache_headers = cache_headers
+
+    def inspect(self, vcf_path: str | Path, count_variants: bool = True) -> InspectionResult:
+        """Inspect a VCF file.
+
+        With ``count_variants=False`` reading stops at the end of the header
+        and ``variant_count`` is left at 0.
+        """
         path = Path(vcf_path)
         result = InspectionResult(file_path=str(vcf_path))
 
-        opener = gzip.open if path.suffix == ".gz" else open
-        mode = "rt" if path.suffix == ".gz" else "r"
-
-        with opener(path, mode) as fh:  # type: ignore[call-overload]
-            for line in fh:
-                line = line.strip()
-                if line.startswith("##"):
-                    result.header_line_count += 1
-                    self._parse_meta_line(line, result)
-                elif line.startswith("#CHROM"):
-                    result.header_line_count += 1
-                    cols = line.split("\t")
-                    if len(cols) > 9:
-                        result.sample_count = len(cols) - 9
-                else:
-                    if line:
-                        result.variant_count += 1
+        if path.suffix == ".gz":
+            with _open_maybe_gz(path) as fh:
+                first_body_line = self._parse_header(fh, result)
+                if count_variants and first_body_line is not None:
+                    result.variant_count = 1 + self._count_body_stream(fh)
+        else:
+            with open(path, "rb") as fh:
+                first_body_line = self._parse_header(fh, result)
+                if count_variants and first_body_line is not None:
+                    if stat.S_ISREG(os.fstat(fh.fileno()).st_mode):
+                        body_start = fh.tell() - len(first_body_line)
+                        result.variant_count = self._count_body_mapped(fh, body_start)
+                    else:
+                        # FIFO or process substitution: cannot seek or mmap
+                        result.variant_count = 1 + self._count_body_stream(fh)
 
         return result
 
+    def inspect_header_only(self, vcf_path: str | Path) -> InspectionResult:
+        """Inspect only the VCF header, skipping the variant body."""
+        return self.inspect(vcf_path, count_variants=False)
+
+    def _parse_header(self, fh: BinaryIO, result: InspectionResult) -> Optional[bytes]:
+        """Parse leading ``#`` lines; return the first body line, or None at EOF."""
+        if self.cache_headers and not self.buffer_ids:
+            return self._parse_header_cached(fh, result)
+
+        targets = self._id_targets(result, self.buffer_ids)
+        first_body_line = None
+        for line in fh:
+            c = line[0]
+            if c == 0x23:
+                self._parse_header_line(line, result, targets)
+            elif c != 0x0A and c != 0x0D:
+                first_body_line = line
+                break
+        self._flush_id_targets(targets, result)
+        return first_body_line
+
+    def _parse_header_cached(self, fh: BinaryIO, result: InspectionResult) -> Optional[bytes]:
+        """Like ``_parse_header``, reusing the parse of a previously seen header.
+
+        The cache is keyed by a BLAKE2 digest of the header lines and holds
+        at most ``_HEADER_CACHE_SIZE`` headers of up to ``_HEADER_CACHE_MAX_BYTES``.
+        """
+        header_lines = []
+        header_bytes = 0
+        digest = hashlib.blake2b(digest_size=16)
+        first_body_line = None
+        for line in fh:
+            c = line[0]
+            if c == 0x23:
+                header_lines.append(line)
+                header_bytes += len(line)
+                digest.update(line)
+            elif c != 0x0A and c != 0x0D:
+                first_body_line = line
+                break
+
+        key = digest.digest()
+        with _HEADER_CACHE_LOCK:
+            parsed = _HEADER_CACHE.get(key)
+            if parsed is not None:
+                _HEADER_CACHE.move_to_end(key)
+        if parsed is None:
+            parsed_result = InspectionResult()
+            targets = self._id_targets(parsed_result, False)
+            for line in header_lines:
+                self._parse_header_line(line, parsed_result, targets)
+            parsed = (
+                parsed_result.header_line_count,
+                parsed_result.sample_count,
+                tuple(parsed_result.contigs),
+                tuple(parsed_result.info_fields),
+                tuple(parsed_result.format_fields),
+            )
+            if header_bytes <= _HEADER_CACHE_MAX_BYTES:
+                with _HEADER_CACHE_LOCK:
+                    _HEADER_CACHE[key] = parsed
+                    while len(_HEADER_CACHE) > _HEADER_CACHE_SIZE:
+                        _HEADER_CACHE.popitem(last=False)
+
+        result.header_line_count, result.sample_count, contigs, info_fields, format_fields = parsed
+        result.contigs = list(contigs)
+        result.info_fields = list(info_fields)
+        result.format_fields = list(format_fields)
+        return first_body_line
+
+    @staticmethod
+    def _count_body_stream(fh: BinaryIO) -> int:
+        count = 0
+        for line in fh:
+            # Branch on the first byte so body lines allocate nothing
+            c = line[0]
+            if c != 0x23 and c != 0x0A and c != 0x0D:
+                count += 1
+        return count
+
+    @staticmethod
+    def _count_body_mapped(fh: BinaryIO, body_start: int) -> int:
+        with sequential_access(fh.fileno()), mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Page faults on a mapping follow madvise, not fadvise
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return count_body_lines(mm, body_start)
+
+    @staticmethod
+    def _id_targets(result: InspectionResult, buffer_ids: bool) -> _IdTargets:
+        if buffer_ids:
+            return {b"contig": bytearray(), b"INFO": bytearray(), b"FORMAT": bytearray()}
+        return {
+            b"contig": result.contigs,
+            b"INFO": result.info_fields,
+            b"FORMAT": result.format_fields,
+        }
+
+    @staticmethod
+    def _flush_id_targets(targets: _IdTargets, result: InspectionResult) -> None:
+        for key, attr in ((b"contig", "contigs"), (b"INFO", "info_fields"), (b"FORMAT", "format_fields")):
+            target = targets[key]
+            if isinstance(target, bytearray):
+                setattr(result, attr, target.decode().split("\0")[:-1])
+
+    def count_only(self, vcf_path: str | Path) -> Tuple[int, int]:
+        """Return ``(sample_count, variant_count)`` without parsing the header.
+
+        Counts every line after ``#CHROM`` as a variant record.
+        """
+        path = Path(vcf_path)
+        if path.suffix == ".gz":
+            with _open_maybe_gz(path) as fh:
+                for line in fh:
+                    if line.startswith(b"#CHROM"):
+                        return self._samples_from_chrom_line(line), count_lines(fh)
+            return 0, 0
+
+        with open(path, "rb") as fh:
+            st = os.fstat(fh.fileno())
+            if not stat.S_ISREG(st.st_mode):
+                for line in fh:
+                    if line.startswith(b"#CHROM"):
+                        return self._samples_from_chrom_line(line), count_lines(fh)
+                return 0, 0
+            if st.st_size == 0:
+                return 0, 0
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:6] == b"#CHROM":
+                    idx = 0
+                else:
+                    idx = mm.find(b"\n#CHROM") + 1
+                    if idx == 0:
+                        return 0, 0
+                line_end = mm.find(b"\n", idx)
+                if line_end < 0:
+                    return self._samples_from_chrom_line(mm[idx:]), 0
+                samples = self._samples_from_chrom_line(mm[idx:line_end])
+            fh.seek(line_end + 1)
+            with sequential_access(fh.fileno()):
+                return samples, count_newlines(fh.fileno())
+
+    @staticmethod
+    def _samples_from_chrom_line(line: bytes) -> int:
+        # Eight tabs separate the fixed columns through FORMAT
+        return max(line.count(b"\t") - 8, 0)
+
+    @staticmethod
+    def _parse_header_line(line: bytes, result: InspectionResult, targets: _IdTargets) -> None:
+        if line.startswith(b"##"):
+            result.header_line_count += 1
+            VCFInspector._parse_meta_line(line, targets)
+        elif line.startswith(b"#CHROM"):
+            result.header_line_count += 1
+            cols = line.split(b"\t")
+            if len(cols) > 9:
+                result.sample_count = len(cols) - 9
+
     @staticmethod
-    def _parse_meta_line(line: str, result: InspectionResult) -> None:
-        if line.startswith("##contig="):
-            # Extract contig ID
-            start = line.find("ID=")
-            if start >= 0:
-                end = line.find(",", start)
-                if end < 0:
-                    end = line.find(">", start)
-                contig_id = line[start + 3: end]
-                if contig_id:
-                    result.contigs.append(contig_id)
-        elif line.startswith("##INFO="):
-            start = line.find("ID=")
-            if start >= 0:
-                end = line.find(",", start)
-                field_id = line[start + 3: end]
-                if field_id:
-                    result.info_fields.append(field_id)
-        elif line.startswith("##FORMAT="):
-            start = line.find("ID=")
-            if start >= 0:
-                end = line.find(",", start)
-                field_id = line[start + 3: end]
-                if field_id:
-                    result.format_fields.append(field_id)
+    def _parse_meta_line(line: bytes, targets: _IdTargets) -> None:
+        m = _META_RE.match(line)
+        if m is None:
+            return
+        target = targets[m.group(1)]
+        if isinstance(target, bytearray):
+            target += m.group(2)
+            target += b"\0"
+        else:
+            target.append(m.group(2).decode())
@@ -6,12 +6,17 @@ Validates VCF and PLINK binary file integrity before conversion.
 from __future__ import annotations
 
 import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, Set
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ValidationReport:
     """Validation outcome for a set of files."""
 
@@ -32,8 +37,9 @@ class FileValidator:
     magic bytes, and file triads.
     """
 
-    VCF_HEADER = "##fileformat=VCF"
+    VCF_HEADER = b"##fileformat=VCF"
     PLINK_BED_MAGIC = b"\x6c\x1b\x01"
+    PARALLEL_MIN_BATCH = 4
 
     def validate_vcf(self, vcf_path: str | Path) -> ValidationReport:
         """Validate a VCF file by checking the header line."""
@@ -45,14 +51,11 @@ class FileValidator:
             return report
 
         try:
-            if path.suffix == ".gz":
-                with gzip.open(path, "rt") as fh:
-                    first_line = fh.readline().strip()
-            else:
-                with open(path) as fh:
-                    first_line = fh.readline().strip()
+            opener = gzip.open if path.suffix == ".gz" else open
+            with opener(path, "rb") as fh:
+                head = fh.read(32)
 
-            if first_line.startswith(self.VCF_HEADER):
+            if head.lstrip().startswith(self.VCF_HEADER):
                 report.valid = 1
             else:
                 report.invalid.append(f"Missing VCF header: {vcf_path}")
@@ -63,39 +66,92 @@ class FileValidator:
 
     def validate_plink_binary(self, bfile_prefix: str | Path) -> ValidationReport:
         """Validate a PLINK binary fileset (.bed/.bim/.fam)."""
-        prefix = Path(bfile_prefix)
+        return self._validate_plink_binary(Path(bfile_prefix))
+
+    def _validate_plink_binary(
+        self,
+        prefix: str | Path,
+        listing: Optional[Set[str]] = None,
+    ) -> ValidationReport:
+        """Validate a fileset, checking presence against ``listing`` when given.
+
+        ``listing`` is the set of names in the directory holding ``prefix``, shared across a
+        batch to replace per-file stat calls.
+        """
         bed = Path(f"{prefix}.bed")
         bim = Path(f"{prefix}.bim")
         fam = Path(f"{prefix}.fam")
         report = ValidationReport(files_checked=3)
 
+        magic = None
+        if listing is None or bed.name in listing:
+            try:
+                fd = os.open(bed, os.O_RDONLY)
+            except FileNotFoundError:
+                pass
+            else:
+                try:
+                    magic = os.read(fd, 3)
+                finally:
+                    os.close(fd)
+
+        present = {"bed": magic is not None}
+        for fp, label in [(bim, "bim"), (fam, "fam")]:
+            present[label] = fp.name in listing if listing is not None else fp.exists()
+
         for fp, label in [(bed, "bed"), (bim, "bim"), (fam, "fam")]:
-            if not fp.exists():
+            if not present[label]:
                 report.invalid.append(f"Missing .{label} file: {fp}")
 
-        if bed.exists():
-            with open(bed, "rb") as fh:
-                magic = fh.read(3)
+        if magic is not None:
             if magic == self.PLINK_BED_MAGIC:
                 report.valid += 1
             else:
                 report.invalid.append(f"Invalid .bed magic bytes: {bed}")
-        if bim.exists():
+        if present["bim"]:
             report.valid += 1
-        if fam.exists():
+        if present["fam"]:
             report.valid += 1
 
         return report
 
+    @staticmethod
+    def _list_dir(directory: str, cache: Dict[str, Set[str]]) -> Set[str]:
+        if directory not in cache:
+            try:
+                cache[directory] = set(os.listdir(directory))
+            except OSError:
+                cache[directory] = set()
+        return cache[directory]
+
     def validate_batch(self, paths: List[str | Path]) -> ValidationReport:
-        """Validate multiple files (VCF or PLINK prefix detection)."""
-        combined = ValidationReport()
+        """Validate multiple files (VCF or PLINK prefix detection).
+
+        Paths ending in ``.vcf`` or ``.gz`` are checked as VCFs; anything else
+        is a PLINK prefix, with a trailing ``.bed`` stripped.
+
+        Batches of ``PARALLEL_MIN_BATCH`` or more paths are validated on a
+        thread pool; results are merged in input order.
+        """
+        listings: Dict[str, Set[str]] = {}
+        tasks: List[Callable[[], ValidationReport]] = []
         for p in paths:
-            path = Path(p)
-            if path.suffix in (".vcf", ".gz"):
-                sub = self.validate_vcf(p)
+            name = os.fspath(p)
+            if name.endswith((".vcf", ".gz")):
+                tasks.append(partial(self.validate_vcf, name))
             else:
-                sub = self.validate_plink_binary(p)
+                prefix = name.removesuffix(".bed")
+                listing = self._list_dir(os.path.dirname(prefix) or ".", listings)
+                tasks.append(partial(self._validate_plink_binary, prefix, listing))
+
+        if len(tasks) < self.PARALLEL_MIN_BATCH:
+            subs = [task() for task in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as pool:
+                subs = list(pool.map(lambda task: task(), tasks))
+
+        combined = ValidationReport()
+        for sub in subs:
             combined.files_checked += sub.files_checked
             combined.valid += sub.valid
             combined.invalid.extend(sub.invalid)
@@ -1,5 +1,9 @@
 """Tests for FormatConverter and FileValidator."""
 
+import gzip
+import shutil
+import subprocess
+
 from vcf_converter.converter import FormatConverter, ConversionResult
 from vcf_converter.validator import FileValidator
 
@@ -19,12 +23,87 @@ class TestFormatConverter:
         assert "--recode" in cmd
         assert "vcf" in cmd
 
+    def test_plink_binary_resolved_once(self):
+        conv = FormatConverter(plink_binary="sh")
+        cmd = conv._build_vcf_to_plink_cmd("in.vcf", "out")
+        assert cmd[0] == shutil.which("sh")
+
+    def test_plink_binary_reassigned(self):
+        conv = FormatConverter(plink_binary="sh")
+        conv._build_vcf_to_plink_cmd("in.vcf", "out")
+        conv.plink_binary = "true"
+        cmd = conv._build_plink_to_vcf_cmd("in", "out")
+        assert cmd[0] == shutil.which("true")
+
+    def test_missing_plink_binary(self):
+        conv = FormatConverter(plink_binary="/nonexistent/plink")
+        result = conv.vcf_to_plink("in.vcf", "out")
+        assert not result.success
+        assert "PLINK binary not found" in result.message
+
     def test_extra_args(self):
         conv = FormatConverter()
         cmd = conv._build_vcf_to_plink_cmd("in.vcf", "out", ["--maf", "0.01"])
         assert "--maf" in cmd
         assert "0.01" in cmd
 
+    def test_parse_plink_counts(self):
+        stdout = (
+            "Total genotyping rate is 0.998.\n"
+            "1204 variants and 96 people pass filters and QC.\n"
+        )
+        assert FormatConverter._parse_plink_counts(stdout) == (1204, 96)
+
+    def test_parse_plink_counts_missing(self):
+        assert FormatConverter._parse_plink_counts("Error: no input\n") is None
+
+    def test_vcf_to_plink_counts_from_log(self, monkeypatch):
+        def fake_run(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, 0, stdout="12 variants and 3 people pass filters and QC.\n")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        result = FormatConverter(plink_binary="sh").vcf_to_plink("in.vcf", "/nonexistent/out")
+        assert result.success
+        assert result.variant_count == 12
+        assert result.sample_count == 3
+
+    def test_vcf_to_plink_batch(self, tmp_path):
+        fake_plink = tmp_path / "plink"
+        fake_plink.write_text(
+            "#!/bin/sh\n"
+            'case "$2" in *bad.vcf) echo "Error: bad input"; exit 2;; esac\n'
+            'echo "7 variants and 4 people pass filters and QC."\n'
+        )
+        fake_plink.chmod(0o755)
+        conv = FormatConverter(plink_binary=str(fake_plink))
+        results = conv.vcf_to_plink_batch([("a.vcf", "a"), ("bad.vcf", "b"), ("c.vcf", "c")])
+        assert [r.success for r in results] == [True, False, True]
+        assert results[0].variant_count == 7
+        assert results[2].sample_count == 4
+        assert "exit status 2" in results[1].message
+
+    def test_vcf_to_plink_batch_unterminated_output(self, tmp_path):
+        fake_plink = tmp_path / "plink"
+        fake_plink.write_text("#!/bin/sh\nprintf '5 variants and 2 people pass filters and QC.'\n")
+        fake_plink.chmod(0o755)
+        conv = FormatConverter(plink_binary=str(fake_plink))
+        results = conv.vcf_to_plink_batch([("a.vcf", "a"), ("b.vcf", "b")])
+        assert [r.success for r in results] == [True, True]
+        assert [(r.variant_count, r.sample_count) for r in results] == [(5, 2), (5, 2)]
+
+    def test_vcf_to_plink_batch_large(self, tmp_path):
+        fake_plink = tmp_path / "plink"
+        fake_plink.write_text("#!/bin/sh\necho '1 variant and 1 people pass filters and QC.'\n")
+        fake_plink.chmod(0o755)
+        shard_dir = "/data/cohort/release_2024/per_chromosome_shards"
+        jobs = [
+            (f"{shard_dir}/chr{i % 22 + 1}_shard{i:05d}.vcf.gz", f"{shard_dir}/plink/shard{i:05d}")
+            for i in range(3000)
+        ]
+        results = FormatConverter(plink_binary=str(fake_plink)).vcf_to_plink_batch(jobs)
+        assert len(results) == 3000
+        assert all(r.success and r.variant_count == 1 for r in results)
+
     def test_count_fam_samples(self, tmp_path):
         fam = tmp_path / "test.fam"
         fam.write_text("FAM1 IND1 0 0 1 -9\nFAM2 IND2 0 0 2 -9\n")
@@ -37,6 +116,30 @@ class TestFormatConverter:
         count = FormatConverter._count_bim_variants(str(bim))
         assert count == 3
 
+    def test_count_bim_unterminated_last_line(self, tmp_path):
+        bim = tmp_path / "test.bim"
+        bim.write_text("1\trs1\t0\t100\tA\tG\n1\trs2\t0\t200\tC\tT")
+        assert FormatConverter._count_bim_variants(str(bim)) == 2
+
+    def test_count_empty_fam(self, tmp_path):
+        fam = tmp_path / "test.fam"
+        fam.write_text("")
+        assert FormatConverter._count_fam_samples(str(fam)) == 0
+
+    def test_approx_count_lines(self, tmp_path):
+        bim = tmp_path / "test.bim"
+        bim.write_text("1\trs1\t0\t100\tA\tG\n" * 1000)
+        assert FormatConverter._approx_count_lines(str(bim)) == 1000
+        assert FormatConverter._approx_count_lines(str(bim), sample=4096) == 1000
+        assert FormatConverter._approx_count_lines("/nonexistent.bim") == 0
+
+    def test_estimate_counts(self, tmp_path):
+        (tmp_path / "cohort.fam").write_text("FAM1 IND1 0 0 1 -9\n" * 40)
+        (tmp_path / "cohort.bim").write_text("1\trs1\t0\t100\tA\tG\n" * 5000)
+        conv = FormatConverter()
+        assert conv.estimate_counts(str(tmp_path / "cohort")) == (40, 5000)
+        assert conv.estimate_counts(str(tmp_path / "missing")) == (0, 0)
+
     def test_count_missing_fam(self):
         assert FormatConverter._count_fam_samples("/nonexistent.fam") == 0
 
@@ -61,6 +164,12 @@ class TestFileValidator:
         report = val.validate_vcf(vcf)
         assert not report.all_valid
 
+    def test_validate_vcf_gz(self, tmp_path):
+        vcf = tmp_path / "test.vcf.gz"
+        with gzip.open(vcf, "wt") as fh:
+            fh.write("##fileformat=VCFv4.2\n#CHROM\tPOS\tID\n")
+        assert FileValidator().validate_vcf(vcf).all_valid
+
     def test_validate_vcf_missing(self):
         val = FileValidator()
         report = val.validate_vcf("/nonexistent.vcf")
@@ -83,3 +192,26 @@ class TestFileValidator:
         val = FileValidator()
         report = val.validate_plink_binary(str(prefix))
         assert not report.all_valid
+
+    def test_validate_batch_plink(self, tmp_path):
+        (tmp_path / "a.bed").write_bytes(b"\x6c\x1b\x01")
+        (tmp_path / "a.bim").write_text("1\trs1\t0\t100\tA\tG\n")
+        (tmp_path / "a.fam").write_text("FAM1 IND1 0 0 1 -9\n")
+        (tmp_path / "b.bed").write_bytes(b"\x00\x00\x00")
+        (tmp_path / "b.bim").write_text("1\trs1\t0\t100\tA\tG\n")
+        val = FileValidator()
+        report = val.validate_batch([str(tmp_path / "a"), tmp_path / "b.bed"])
+        assert report.files_checked == 6
+        assert report.valid == 4
+        assert len(report.invalid) == 2
+
+    def test_validate_batch_parallel_order(self, tmp_path):
+        paths = []
+        for i in range(8):
+            vcf = tmp_path / f"s{i}.vcf"
+            vcf.write_text("##fileformat=VCFv4.2\n" if i % 2 else "bad\n")
+            paths.append(str(vcf))
+        report = FileValidator().validate_batch(paths)
+        assert report.files_checked == 8
+        assert report.valid == 4
+        assert report.invalid == [f"Missing VCF header: {p}" for p in paths[::2]]
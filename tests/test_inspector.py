@@ -1,5 +1,17 @@
 """Tests for VCFInspector."""
 
+import gzip
+import mmap
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+import pytest
+
+from vcf_converter import _gz, _scan
+from vcf_converter import inspector as inspector_module
+from vcf_converter._scan import count_body_lines, count_newlines
 from vcf_converter.inspector import VCFInspector
 
 
@@ -28,6 +40,58 @@ class TestVCFInspector:
         assert "AC" in result.info_fields
         assert "GT" in result.format_fields
 
+    def test_meta_line_ids(self, tmp_path):
+        content = (
+            "##fileformat=VCFv4.2\n"
+            "##contig=<ID=chrUn_1>\n"
+            "##contig=<ID=chr2,length=100>\n"
+            '##INFO=<ID=DP,Number=1,Type=Integer,Description="Depth">\n'
+            "##FILTER=<ID=q10,Description=\"Low quality\">\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+        )
+        vcf = self._write_vcf(tmp_path, content)
+        result = VCFInspector().inspect(vcf)
+        assert result.contigs == ["chrUn_1", "chr2"]
+        assert result.info_fields == ["DP"]
+        assert result.format_fields == []
+
+    def test_buffered_ids(self, tmp_path):
+        contigs = [f"scaffold_{i}" for i in range(500)]
+        content = (
+            "##fileformat=VCFv4.2\n"
+            + "".join(f"##contig=<ID={c}>\n" for c in contigs)
+            + '##INFO=<ID=DP,Number=1,Type=Integer,Description="Depth">\n'
+            + "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+        )
+        vcf = self._write_vcf(tmp_path, content)
+        result = VCFInspector(buffer_ids=True).inspect(vcf)
+        assert result.contigs == contigs
+        assert result.info_fields == ["DP"]
+        assert result.format_fields == []
+
+    def test_shared_header_parsed_once(self, tmp_path, monkeypatch):
+        header = (
+            "##fileformat=VCFv4.2\n"
+            "##contig=<ID=shared_1>\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+        )
+        monkeypatch.setattr(inspector_module, "_HEADER_CACHE", OrderedDict())
+        calls = []
+        parse_meta_line = VCFInspector._parse_meta_line
+        monkeypatch.setattr(
+            VCFInspector, "_parse_meta_line", staticmethod(lambda *a: calls.append(1) or parse_meta_line(*a))
+        )
+        inspector = VCFInspector(cache_headers=True)
+        for i in range(3):
+            vcf = tmp_path / f"shard{i}.vcf"
+            vcf.write_text(header + f"1\t{100 + i}\t.\tA\tG\t.\t.\t.\n")
+            result = inspector.inspect(vcf)
+            assert result.contigs == ["shared_1"]
+            assert result.header_line_count == 3
+            assert result.variant_count == 1
+        # Two ## lines parsed once; later shards hit the cache
+        assert len(calls) == 2
+
     def test_multiple_samples(self, tmp_path):
         content = (
             "##fileformat=VCFv4.2\n"
@@ -55,3 +119,125 @@ class TestVCFInspector:
         vcf = self._write_vcf(tmp_path, content)
         result = VCFInspector().inspect(vcf)
         assert result.header_line_count == 3
+
+    def test_gzipped_vcf(self, tmp_path):
+        vcf = tmp_path / "test.vcf.gz"
+        with gzip.open(vcf, "wt") as fh:
+            fh.write(
+                "##fileformat=VCFv4.2\n"
+                "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\n"
+                "1\t100\trs1\tA\tG\t.\t.\t.\tGT\t0/1\n"
+            )
+        result = VCFInspector().inspect(vcf)
+        assert result.sample_count == 1
+        assert result.variant_count == 1
+
+    @pytest.mark.skipif(shutil.which("gzip") is None, reason="gzip binary not available")
+    def test_gzipped_vcf_via_pipe(self, tmp_path, monkeypatch):
+        # gzip -dc is a drop-in stand-in for pigz -dc
+        gzip_bin = shutil.which("gzip")
+        monkeypatch.setattr(_gz.shutil, "which", lambda name: gzip_bin)
+        self.test_gzipped_vcf(tmp_path)
+
+    def test_inspect_header_only(self, tmp_path):
+        content = (
+            "##fileformat=VCFv4.2\n"
+            "##contig=<ID=1,length=249250621>\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\n"
+            "1\t100\trs1\tA\tG\t.\t.\t.\tGT\t0/1\n"
+        )
+        vcf = self._write_vcf(tmp_path, content)
+        result = VCFInspector().inspect_header_only(vcf)
+        assert result.sample_count == 1
+        assert result.contigs == ["1"]
+        assert result.header_line_count == 3
+        assert result.variant_count == 0
+
+    def test_count_only(self, tmp_path):
+        content = (
+            "##fileformat=VCFv4.2\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\tS2\n"
+            "1\t100\trs1\tA\tG\t.\t.\t.\tGT\t0/1\t0/0\n"
+            "1\t200\trs2\tC\tT\t.\t.\t.\tGT\t1/1\t0/1\n"
+        )
+        vcf = self._write_vcf(tmp_path, content)
+        assert VCFInspector().count_only(vcf) == (2, 2)
+
+        gz = tmp_path / "test.vcf.gz"
+        with gzip.open(gz, "wt") as fh:
+            fh.write(content)
+        assert VCFInspector().count_only(gz) == (2, 2)
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes not available")
+    def test_fifo_input(self, tmp_path):
+        content = (
+            b"##fileformat=VCFv4.2\n"
+            b"#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\n"
+            b"1\t100\trs1\tA\tG\t.\t.\t.\tGT\t0/1\n"
+            b"1\t200\trs2\tC\tT\t.\t.\t.\tGT\t1/1\n"
+        )
+        fifo = tmp_path / "input.vcf"
+        os.mkfifo(fifo)
+
+        def run(call):
+            writer = threading.Thread(target=fifo.write_bytes, args=(content,))
+            writer.start()
+            try:
+                return call(fifo)
+            finally:
+                writer.join()
+
+        result = run(VCFInspector().inspect)
+        assert (result.sample_count, result.variant_count) == (1, 2)
+        assert run(VCFInspector().count_only) == (1, 2)
+
+    @pytest.mark.skipif(shutil.which("gzip") is None, reason="gzip binary not available")
+    def test_truncated_gz_via_pipe(self, tmp_path, monkeypatch):
+        gzip_bin = shutil.which("gzip")
+        monkeypatch.setattr(_gz.shutil, "which", lambda name: gzip_bin)
+        self._assert_truncated_gz_raises(tmp_path)
+
+    def test_truncated_gz_via_gzip_module(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_gz.shutil, "which", lambda name: None)
+        self._assert_truncated_gz_raises(tmp_path)
+
+    def _assert_truncated_gz_raises(self, tmp_path):
+        body = "".join(f"1\t{i}\t.\tA\tG\t.\t.\t.\n" for i in range(20000))
+        data = gzip.compress(("##fileformat=VCFv4.2\n#CHROM\tPOS\n" + body).encode())
+        vcf = tmp_path / "truncated.vcf.gz"
+        vcf.write_bytes(data[: len(data) // 2])
+        inspector = VCFInspector()
+        with pytest.raises(gzip.BadGzipFile):
+            inspector.inspect(vcf)
+        with pytest.raises(gzip.BadGzipFile):
+            inspector.count_only(vcf)
+        # Header-only reads stop early and do not see the truncation
+        assert inspector.inspect_header_only(vcf).header_line_count == 2
+
+    def test_count_body_lines(self):
+        buf = b"#CHROM\n1\t100\n\n1\t200"
+        assert count_body_lines(buf) == 2
+        assert count_body_lines(buf, start=7) == 2
+
+    def test_numba_kernel_matches_python(self, tmp_path):
+        pytest.importorskip("numpy")
+        pytest.importorskip("numba")
+        kernel = _scan._get_kernel()
+        assert kernel is not None
+        assert _scan._get_kernel() is kernel
+        buf = b"#CHROM\tPOS\n1\t100\n\n\r\n1\t200\rX\n#late\n2\t300\n  \n3\t400"
+        path = tmp_path / "body.vcf"
+        path.write_bytes(buf)
+        with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in (0, 12, 19, len(buf) - 7):
+                expected = _scan._count_body_python(buf, start)
+                assert _scan._count_body_python(mm, start) == expected
+                assert kernel(buf, start) == expected
+                assert kernel(mm, start) == expected
+                assert count_body_lines(mm, start) == expected
+
+    def test_count_newlines(self, tmp_path):
+        path = tmp_path / "lines.txt"
+        path.write_bytes(b"a\n" * 10 + b"tail")
+        with open(path, "rb") as fh:
+            assert count_newlines(fh.fileno(), chunk_size=7) == 11